@@ -3,25 +3,14 @@
 from __future__ import annotations
 
 import argparse
-import os
 from pathlib import Path
 from typing import Optional
 
 from openai import OpenAI
 
-# Load environment variables from .env file if it exists
-try:
-    from dotenv import load_dotenv
-    load_dotenv()
-except ImportError:
-    pass  # dotenv not installed, assume env vars are set
-
-from config import DEFAULT_AUDIO_PATH, DEFAULT_MODEL, OPENAI_API_KEY
+from config import DEFAULT_AUDIO_PATH, DEFAULT_MODEL, init_env
 from service import TranscriptionOptions, TranscriptionService, transcription_to_payload
 
-# Set API key for OpenAI
-os.environ["OPENAI_API_KEY"] = OPENAI_API_KEY
-
 
 def build_parser() -> argparse.ArgumentParser:
     """Build the command-line argument parser."""
@@ -68,7 +57,9 @@ def main(argv: Optional[list[str]] = None) -> int:
     parser = build_parser()
     args = parser.parse_args(argv)
 
-    service = TranscriptionService(OpenAI())
+    init_env()
+    # A one-shot run never sees a cache hit, so skip hashing the file.
+    service = TranscriptionService(OpenAI(), cache=None)
     options = TranscriptionOptions(
         model=args.model, response_format=args.response_format, prompt=args.prompt
     )
@@ -1,13 +1,20 @@
 """Configuration constants for the audio transcription service."""
 
 import os
+from functools import lru_cache
 from pathlib import Path
+from typing import FrozenSet
 
 DEFAULT_MODEL = "gpt-4o-transcribe"
 DEFAULT_AUDIO_PATH = Path("/Users/aryamandubey/Downloads/Walpole Road.mp3")
 MAX_UPLOAD_BYTES = 25 * 1024 * 1024  # 25 MB
+CACHE_MAX_ENTRIES = 256
+CACHE_TTL_SECONDS = 24 * 60 * 60  # 1 day
+BATCH_MAX_WORKERS = 4
+DEFAULT_MAX_CONCURRENT_TRANSCRIBES = 8
+TRANSCRIBE_QUEUE_TIMEOUT_SECONDS = 2.0
 
-SUPPORTED_CONTENT_TYPES = {
+SUPPORTED_CONTENT_TYPES: FrozenSet[str] = frozenset({
     "audio/mpeg",
     "audio/mp3",
     "audio/mp4",
@@ -17,10 +24,34 @@ SUPPORTED_CONTENT_TYPES = {
     "audio/m4a",
     "audio/wav",
     "audio/webm",
-}
+})
 
-# API Key - Load from environment variable
-OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
-if not OPENAI_API_KEY:
-    raise ValueError("OPENAI_API_KEY environment variable is not set. Please set it in your .env file or environment.")
 
+@lru_cache(maxsize=None)
+def init_env() -> str:
+    """Load the .env file once per process and return the OpenAI API key."""
+    try:
+        from dotenv import load_dotenv
+    except ImportError:
+        pass  # dotenv not installed, assume env vars are set
+    else:
+        load_dotenv()
+
+    api_key = os.getenv("OPENAI_API_KEY")
+    if not api_key:
+        raise ValueError("OPENAI_API_KEY environment variable is not set. Please set it in your .env file or environment.")
+    return api_key
+
+
+def max_concurrent_transcribes() -> int:
+    """Return the MAX_CONCURRENT_TRANSCRIBES setting; call after ``init_env``."""
+    raw = os.getenv("MAX_CONCURRENT_TRANSCRIBES")
+    if raw is None:
+        return DEFAULT_MAX_CONCURRENT_TRANSCRIBES
+    try:
+        value = int(raw)
+    except ValueError:
+        value = 0
+    if value < 1:
+        raise ValueError(f"MAX_CONCURRENT_TRANSCRIBES must be a positive integer, got {raw!r}.")
+    return value
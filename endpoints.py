@@ -1,31 +1,131 @@
 """FastAPI endpoints for audio transcription service."""
 
+import asyncio
 import io
 import os
-from typing import Optional
+from functools import lru_cache
+from typing import BinaryIO, Optional
 
-from fastapi import FastAPI, File, HTTPException, UploadFile
+from fastapi import FastAPI, File, HTTPException, Response, UploadFile
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import JSONResponse
 from openai import OpenAI
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
-# Load environment variables from .env file if it exists
-try:
-    from dotenv import load_dotenv
-    load_dotenv()
-except ImportError:
-    pass  # dotenv not installed, assume env vars are set
+from config import (
+    DEFAULT_MODEL,
+    MAX_UPLOAD_BYTES,
+    SUPPORTED_CONTENT_TYPES,
+    TRANSCRIBE_QUEUE_TIMEOUT_SECONDS,
+    init_env,
+    max_concurrent_transcribes,
+)
+from service import TranscriptionOptions, TranscriptionService, transcription_to_json_bytes
 
-from config import DEFAULT_MODEL, MAX_UPLOAD_BYTES, OPENAI_API_KEY, SUPPORTED_CONTENT_TYPES
-from service import TranscriptionOptions, TranscriptionService, transcription_to_payload
-
-# Set API key for OpenAI
-os.environ["OPENAI_API_KEY"] = OPENAI_API_KEY
+init_env()
 
 app = FastAPI(title="Audio Transcription API")
 
+# Allowance for multipart boundaries, headers and form fields around the file.
+MULTIPART_OVERHEAD_BYTES = 64 * 1024
+RETRY_AFTER_SECONDS = 2
+
+# Bounds in-flight OpenAI calls; requests that cannot get a slot in time get a 429.
+# Read after init_env() so a value set in .env is honoured.
+_transcribe_slots = asyncio.Semaphore(max_concurrent_transcribes())
+
+
+class UploadSizeLimitMiddleware:
+    """Reject request bodies larger than ``max_body_bytes`` before they are parsed.
+
+    FastAPI reads the whole multipart form before the endpoint runs, so the
+    limit has to be enforced on the raw ASGI stream: a declared Content-Length
+    is checked up front, and body bytes are counted as they arrive so chunked
+    uploads without that header are cut off too.
+    """
+
+    def __init__(self, app: ASGIApp, max_body_bytes: int):
+        self.app = app
+        self.max_body_bytes = max_body_bytes
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        content_length = Headers(scope=scope).get("content-length")
+        if (
+            content_length
+            and content_length.isdigit()
+            and int(content_length) > self.max_body_bytes
+        ):
+            await _upload_too_large()(scope, receive, send)
+            return
+
+        received = 0
+        rejected = False
+        response_started = False
+
+        async def limited_receive() -> Message:
+            nonlocal received, rejected
+            if rejected:
+                return {"type": "http.disconnect"}
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > self.max_body_bytes:
+                    rejected = True
+                    if not response_started:
+                        await _upload_too_large()(scope, receive, send)
+                    # Stop the app reading further; it sees a client disconnect.
+                    return {"type": "http.disconnect"}
+            return message
+
+        async def guarded_send(message: Message) -> None:
+            nonlocal response_started
+            if rejected:
+                return  # The 413 has already been sent.
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
+        await self.app(scope, limited_receive, guarded_send)
+
+
+def _upload_too_large() -> JSONResponse:
+    return JSONResponse(
+        status_code=413,
+        content={"detail": "File exceeds the 25 MB limit. Please compress or split it."},
+    )
+
+
+app.add_middleware(
+    UploadSizeLimitMiddleware,
+    max_body_bytes=MAX_UPLOAD_BYTES + MULTIPART_OVERHEAD_BYTES,
+)
+
 
+def _upload_handle(upload: BinaryIO) -> BinaryIO:
+    """Return a handle for the SDK that keeps small uploads off disk.
+
+    httpx sizes file bodies with ``fileno()``, which makes a
+    SpooledTemporaryFile still held in memory (at most 1 MB) roll over to a
+    temp file on disk. Hand those over as an in-memory buffer instead; uploads
+    already on disk are passed through unchanged.
+    """
+    if getattr(upload, "_rolled", True):
+        return upload
+    return io.BytesIO(upload.read())
+
+
+@lru_cache(maxsize=None)
 def _get_service() -> TranscriptionService:
-    """Factory function to create a TranscriptionService instance."""
+    """Return the process-wide TranscriptionService.
+
+    The OpenAI client is created once so its HTTP connection pool is reused
+    across requests instead of paying a fresh TLS handshake per upload.
+    """
     return TranscriptionService(OpenAI())
 
 
@@ -35,7 +135,7 @@ async def transcribe_endpoint(
     model: str = DEFAULT_MODEL,
     response_format: Optional[str] = None,
     prompt: Optional[str] = None,
-) -> JSONResponse:
+) -> Response:
     """
     Transcribe an uploaded audio file.
 
@@ -46,7 +146,7 @@ async def transcribe_endpoint(
         prompt: Optional prompt to guide transcription
 
     Returns:
-        JSONResponse containing the transcription result
+        JSON response containing the transcription result
     """
     if file.content_type and file.content_type not in SUPPORTED_CONTENT_TYPES:
         raise HTTPException(
@@ -54,33 +154,61 @@ async def transcribe_endpoint(
             detail=f"Unsupported content type: {file.content_type}",
         )
 
-    contents = await file.read()
-    if not contents:
+    # Starlette has already spooled the upload to a SpooledTemporaryFile; reuse
+    # it rather than copying large uploads again.
+    upload = file.file
+    upload.seek(0, os.SEEK_END)
+    size = upload.tell()
+    upload.seek(0)
+    if size == 0:
         raise HTTPException(status_code=400, detail="Uploaded file is empty.")
-    if len(contents) > MAX_UPLOAD_BYTES:
-        human_size = f"{len(contents) / (1024 * 1024):.1f} MB"
+    # UploadSizeLimitMiddleware has already capped the raw body, chunked or
+    # not, at the limit plus multipart overhead; this applies the exact limit
+    # to the file part itself.
+    if size > MAX_UPLOAD_BYTES:
+        human_size = f"{size / (1024 * 1024):.1f} MB"
         raise HTTPException(
             status_code=413,
             detail=f"File is {human_size}; limit is 25 MB. Please compress or split it.",
         )
 
-    buffer = io.BytesIO(contents)
-    buffer.name = file.filename or "audio_upload.mp3"
-    buffer.seek(0)
-
+    upload = _upload_handle(upload)
     service = _get_service()
     options = TranscriptionOptions(
         model=model, response_format=response_format, prompt=prompt
     )
 
-    try:
-        transcription = service.transcribe_stream(
-            file_handle=buffer,
-            options=options,
-        )
-    except Exception as exc:  # noqa: BLE001
-        raise HTTPException(status_code=502, detail=str(exc)) from exc
-
-    payload = transcription_to_payload(transcription)
-    return JSONResponse(content=payload)
-
+    # Answer repeated uploads from the cache without taking a slot: the
+    # semaphore only bounds outbound OpenAI calls. Hashing is blocking I/O.
+    cache_key = await run_in_threadpool(service.cache_key, upload, options)
+    transcription = service.cached(cache_key)
+    if transcription is None:
+        try:
+            await asyncio.wait_for(
+                _transcribe_slots.acquire(), timeout=TRANSCRIBE_QUEUE_TIMEOUT_SECONDS
+            )
+        except asyncio.TimeoutError as exc:
+            raise HTTPException(
+                status_code=429,
+                detail="Transcription service is busy. Please retry shortly.",
+                headers={"Retry-After": str(RETRY_AFTER_SECONDS)},
+            ) from exc
+
+        try:
+            # The SDK call is blocking; keep it off the event loop.
+            transcription = await run_in_threadpool(
+                service.transcribe_stream,
+                file_handle=upload,
+                options=options,
+                filename=file.filename or "audio_upload.mp3",
+                cache_key=cache_key,
+            )
+        except Exception as exc:  # noqa: BLE001
+            raise HTTPException(status_code=502, detail=str(exc)) from exc
+        finally:
+            _transcribe_slots.release()
+
+    return Response(
+        content=transcription_to_json_bytes(transcription),
+        media_type="application/json",
+    )
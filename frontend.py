@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
+import html
 import io
 from typing import Any, Dict, Optional
 
-import requests
+import httpx
 import streamlit as st
 
 try:
@@ -15,6 +16,31 @@ except ImportError:
 
 
 DEFAULT_TRANSCRIBE_URL = "http://localhost:8000/transcribe"
+# Mirrors config.MAX_UPLOAD_BYTES on the backend.
+MAX_UPLOAD_BYTES = 25 * 1024 * 1024
+
+TRANSCRIPT_CARD_HEADER = """
+<div style="
+    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+    padding: 2rem;
+    border-radius: 12px;
+    box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
+    margin: 1rem 0;
+">
+    <div style="
+        background: white;
+        padding: 1.5rem;
+        border-radius: 8px;
+        color: #333;
+        font-size: 1.1rem;
+        line-height: 1.8;
+        font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
+    ">
+"""
+TRANSCRIPT_CARD_FOOTER = """
+    </div>
+</div>
+"""
 
 
 def convert_audio_to_mp3(audio_bytes: bytes, source_format: str = None) -> bytes:
@@ -39,12 +65,23 @@ def convert_audio_to_mp3(audio_bytes: bytes, source_format: str = None) -> bytes
     return mp3_buffer.getvalue()
 
 
-def post_for_transcription(mp3_bytes: bytes, endpoint: str) -> Dict[str, Any]:
-    """Send the MP3 bytes to the backend transcription endpoint."""
+@st.cache_resource
+def _http_client() -> httpx.Client:
+    """Return an HTTP client shared across reruns so connections are reused."""
+    return httpx.Client(timeout=60.0)
+
+
+def post_for_transcription(
+    audio_bytes: bytes,
+    endpoint: str,
+    filename: str = "recording.wav",
+    content_type: str = "audio/wav",
+) -> Dict[str, Any]:
+    """Send the audio bytes to the backend transcription endpoint."""
     files = {
-        "file": ("recording.mp3", mp3_bytes, "audio/mpeg"),
+        "file": (filename, io.BytesIO(audio_bytes), content_type),
     }
-    response = requests.post(endpoint, files=files, timeout=60)
+    response = _http_client().post(endpoint, files=files)
     response.raise_for_status()
     return response.json()
 
@@ -142,13 +179,20 @@ def main() -> None:
                 "No audio captured. Please record again."
             )
         else:
-            with st.spinner("Converting audio and contacting the transcription API..."):
+            with st.spinner("Contacting the transcription API..."):
                 try:
-                    # The recorded audio from st.experimental_audio_input is in WAV format
-                    wav_bytes = audio_file.getvalue()
-                    mp3_bytes = convert_audio_to_mp3(wav_bytes, source_format="wav")
-                    
-                    payload = post_for_transcription(mp3_bytes, endpoint)
+                    # The recorded audio from st.experimental_audio_input is in WAV format,
+                    # which the backend accepts as-is. Only fall back to an MP3
+                    # re-encode when the WAV is too large to upload.
+                    audio_bytes = audio_file.getvalue()
+                    filename, content_type = "recording.wav", "audio/wav"
+                    if len(audio_bytes) > MAX_UPLOAD_BYTES:
+                        audio_bytes = convert_audio_to_mp3(audio_bytes, source_format="wav")
+                        filename, content_type = "recording.mp3", "audio/mpeg"
+
+                    payload = post_for_transcription(
+                        audio_bytes, endpoint, filename=filename, content_type=content_type
+                    )
                     st.session_state["raw_payload"] = payload
                     transcript_text = extract_text(payload)
                     if transcript_text:
@@ -169,27 +213,13 @@ def main() -> None:
         elif st.session_state["transcript"]:
             # Display transcript in a nice styled container
             st.markdown(
-                f"""
-                <div style="
-                    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                    padding: 2rem;
-                    border-radius: 12px;
-                    box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
-                    margin: 1rem 0;
-                ">
-                    <div style="
-                        background: white;
-                        padding: 1.5rem;
-                        border-radius: 8px;
-                        color: #333;
-                        font-size: 1.1rem;
-                        line-height: 1.8;
-                        font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-                    ">
-                        {st.session_state["transcript"]}
-                    </div>
-                </div>
-                """,
+                "".join(
+                    (
+                        TRANSCRIPT_CARD_HEADER,
+                        html.escape(st.session_state["transcript"]),
+                        TRANSCRIPT_CARD_FOOTER,
+                    )
+                ),
                 unsafe_allow_html=True,
             )
             
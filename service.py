@@ -2,26 +2,46 @@
 
 from __future__ import annotations
 
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, BinaryIO, Dict, Optional
+from typing import Any, BinaryIO, Dict, Iterable, List, Optional, Tuple
 
+import orjson
 from openai import OpenAI
 
-from config import DEFAULT_MODEL, MAX_UPLOAD_BYTES
+from config import (
+    BATCH_MAX_WORKERS,
+    CACHE_MAX_ENTRIES,
+    CACHE_TTL_SECONDS,
+    DEFAULT_MODEL,
+    MAX_UPLOAD_BYTES,
+)
 
+HASH_CHUNK_BYTES = 1024 * 1024
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class TranscriptionOptions:
-    """Options for configuring audio transcription requests."""
+    """Options for configuring audio transcription requests.
+
+    Instances are immutable and hashable so they can be used as cache keys.
+    """
 
     model: str = DEFAULT_MODEL
     response_format: Optional[str] = None
     prompt: Optional[str] = None
 
-    def build_kwargs(self, file_handle: BinaryIO) -> Dict[str, Any]:
+    def build_kwargs(
+        self, file_handle: BinaryIO, filename: Optional[str] = None
+    ) -> Dict[str, Any]:
         """Build keyword arguments for the OpenAI API call."""
-        kwargs: Dict[str, Any] = {"file": file_handle, "model": self.model}
+        file: Any = (filename, file_handle) if filename else file_handle
+        kwargs: Dict[str, Any] = {"file": file, "model": self.model}
         if self.response_format:
             kwargs["response_format"] = self.response_format
         if self.prompt:
@@ -29,20 +49,112 @@ class TranscriptionOptions:
         return kwargs
 
 
+CacheKey = Tuple[str, TranscriptionOptions]
+
+
+class TranscriptionCache:
+    """Thread-safe in-memory LRU cache of transcription results with a TTL."""
+
+    def __init__(
+        self,
+        max_entries: int = CACHE_MAX_ENTRIES,
+        ttl_seconds: float = CACHE_TTL_SECONDS,
+    ):
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[CacheKey, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: CacheKey) -> Optional[Any]:
+        """Return the cached result for ``key``, or None if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: CacheKey, value: Any) -> None:
+        """Store ``value`` under ``key``, evicting the least recently used entry."""
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self._ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+
+_default_cache = TranscriptionCache()
+# Sentinel so that ``cache=None`` can mean "no caching".
+_DEFAULT_CACHE: Any = object()
+
+
+def content_digest(file_handle: BinaryIO) -> str:
+    """Hash the remaining contents of a seekable handle, then rewind it."""
+    start = file_handle.tell()
+    digest = hashlib.blake2b(digest_size=16)
+    while chunk := file_handle.read(HASH_CHUNK_BYTES):
+        digest.update(chunk)
+    file_handle.seek(start)
+    return digest.hexdigest()
+
+
 class TranscriptionService:
     """Service for transcribing audio files using OpenAI's Audio API."""
 
-    def __init__(self, client: OpenAI):
+    def __init__(
+        self,
+        client: OpenAI,
+        cache: Optional[TranscriptionCache] = _DEFAULT_CACHE,
+    ):
+        """Create a service; pass ``cache=None`` to disable result caching."""
         self._client = client
+        self._cache: Optional[TranscriptionCache] = (
+            _default_cache if cache is _DEFAULT_CACHE else cache
+        )
+
+    def cache_key(
+        self, file_handle: BinaryIO, options: TranscriptionOptions
+    ) -> Optional[CacheKey]:
+        """Return the cache key for this audio and options, or None if caching is off."""
+        if self._cache is None:
+            return None
+        return (content_digest(file_handle), options)
+
+    def cached(self, key: Optional[CacheKey]) -> Optional[Any]:
+        """Return the cached transcription for ``key``, if there is one."""
+        if self._cache is None or key is None:
+            return None
+        return self._cache.get(key)
 
     def transcribe_stream(
         self,
         file_handle: BinaryIO,
         options: TranscriptionOptions,
+        filename: Optional[str] = None,
+        cache_key: Optional[CacheKey] = None,
     ) -> Any:
-        """Transcribe audio from a file-like object."""
-        kwargs = options.build_kwargs(file_handle)
-        return self._client.audio.transcriptions.create(**kwargs)
+        """Transcribe audio from a file-like object.
+
+        ``filename`` overrides the name sent with the upload, for handles such as
+        temporary files whose own name does not carry the audio extension.
+        When caching is enabled, results are cached by audio content and
+        options, so the handle must be seekable. Pass a ``cache_key`` from
+        ``cache_key()`` to avoid hashing the audio a second time.
+        """
+        key = cache_key if cache_key is not None else self.cache_key(file_handle, options)
+        cached = self.cached(key)
+        if cached is not None:
+            return cached
+
+        kwargs = options.build_kwargs(file_handle, filename=filename)
+        transcription = self._client.audio.transcriptions.create(**kwargs)
+        if self._cache is not None and key is not None:
+            self._cache.set(key, transcription)
+        return transcription
 
     def transcribe_path(
         self,
@@ -63,9 +175,37 @@ class TranscriptionService:
                 " Please compress or split the audio and retry."
             )
 
+        # Hand the SDK an open handle rather than the Path: paths are read fully
+        # into memory, whereas file objects are streamed into the multipart body.
         with audio_path.open("rb") as file_handle:
             return self.transcribe_stream(file_handle=file_handle, options=options)
 
+    def transcribe_paths(
+        self,
+        audio_paths: Iterable[Path],
+        options: TranscriptionOptions,
+        max_workers: int = BATCH_MAX_WORKERS,
+    ) -> List[Any]:
+        """Transcribe several audio files concurrently, in input order.
+
+        Each file is read and uploaded on its own worker thread so disk reads
+        and network uploads of different files overlap. As soon as one file
+        fails, files that have not started are cancelled (so they are neither
+        uploaded nor billed), uploads already in progress are allowed to
+        finish, and the failure is raised.
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(self.transcribe_path, audio_path=path, options=options)
+                for path in audio_paths
+            ]
+            done, _ = wait(futures, return_when=FIRST_EXCEPTION)
+            failed = [f for f in futures if f in done and f.exception() is not None]
+            if failed:
+                executor.shutdown(wait=True, cancel_futures=True)
+                raise failed[0].exception()
+            return [future.result() for future in futures]
+
 
 def transcription_to_payload(transcription: Any) -> Dict[str, Any]:
     """Convert a transcription response to a dictionary payload."""
@@ -80,3 +220,13 @@ def transcription_to_payload(transcription: Any) -> Dict[str, Any]:
 
     return {"text": str(transcription)}
 
+
+def transcription_to_json_bytes(transcription: Any) -> bytes:
+    """Serialize a transcription response to JSON bytes.
+
+    Pydantic SDK models serialize directly, skipping the intermediate dict
+    built by ``transcription_to_payload``.
+    """
+    if hasattr(transcription, "model_dump_json"):
+        return transcription.model_dump_json().encode("utf-8")
+    return orjson.dumps(transcription_to_payload(transcription))